@@ -76,3 +76,48 @@ def define_env(env):
         
         info = summaries.get(section_name, {"count": 0, "description": "Documentation section"})
         return f"{info['count']} pages covering {info['description']}"
+    
+    def _link_index():
+        """Return the backlink index precomputed by the link_index plugin."""
+        plugin = env.conf['plugins'].get('link_index')
+        return plugin.index if plugin is not None else None
+    
+    def _relative_link(src_path, from_path):
+        """Return a markdown link path to `src_path` relative to `from_path`."""
+        import posixpath
+        return posixpath.relpath(src_path, posixpath.dirname(from_path) or '.')
+    
+    @env.macro
+    def backlinks(target=None, anchor=None):
+        """List the pages that link to a page (defaults to the current page)."""
+        index = _link_index()
+        if index is None:
+            return "_Backlinks unavailable: the `link_index` plugin is not enabled._"
+        
+        current = env.page.file.src_uri
+        target = target or current
+        referrers = index.referrers(target, anchor)
+        if not referrers:
+            return "_No other pages link here._"
+        
+        return "\n".join(
+            f"- [{index.titles.get(src, src)}]({_relative_link(src, current)})"
+            for src in referrers
+        )
+    
+    @env.macro
+    def orphans():
+        """List pages that are neither in the nav nor linked from any other page."""
+        index = _link_index()
+        if index is None:
+            return "_Orphan detection unavailable: the `link_index` plugin is not enabled._"
+        
+        current = env.page.file.src_uri
+        pages = index.orphans()
+        if not pages:
+            return "_No orphaned pages._"
+        
+        return "\n".join(
+            f"- [{index.titles.get(src, src)}]({_relative_link(src, current)})"
+            for src in pages
+        )
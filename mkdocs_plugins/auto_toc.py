@@ -21,20 +21,26 @@ class AutoTocPlugin(BasePlugin):
     def on_page_markdown(self, markdown, page, config, files):
         """Process markdown content to inject auto-generated TOC."""
         
-        if not self.config['enabled']:
-            return markdown
-            
-        marker = self.config['marker']
+        return self.expand_marker(markdown, config)
+    
+    def generated_toc(self, markdown, config):
+        """Return the TOC content that would replace the marker in `markdown`.
         
-        # Only process if marker is found
-        if marker not in markdown:
+        Returns None when the plugin is disabled or the marker is absent.
+        Other plugins use this to see generated links before pages render.
+        """
+        if not self.config['enabled'] or self.config['marker'] not in markdown:
+            return None
+        
+        return self._generate_toc(config.get('nav', []), config['docs_dir'])
+    
+    def expand_marker(self, markdown, config):
+        """Return `markdown` with the marker replaced by the generated TOC."""
+        toc_content = self.generated_toc(markdown, config)
+        if toc_content is None:
             return markdown
-            
-        # Generate the TOC from navigation
-        toc_content = self._generate_toc(config.get('nav', []), config['docs_dir'])
         
-        # Replace marker with generated content
-        return markdown.replace(marker, toc_content)
+        return markdown.replace(self.config['marker'], toc_content)
     
     def _generate_toc(self, nav_items, docs_dir, level=0):
         """Generate TOC content from navigation structure and file metadata."""
@@ -0,0 +1,179 @@
+"""
+MkDocs plugin to build a cross-reference (backlink) index once per build.
+
+Every documentation page is scanned a single time when the navigation is
+built. The result is an inverted index mapping each target page (and anchor)
+to the pages that link to it. The `backlinks()` and `orphans()` macros in
+`main.py` read this precomputed index instead of rescanning files per page.
+
+Links generated by the `auto_toc` marker are expanded before scanning. Links
+produced by macros are not: macros are only rendered later, per page.
+"""
+
+import logging
+import posixpath
+import re
+from urllib.parse import unquote, urlsplit
+
+from mkdocs.plugins import BasePlugin
+from mkdocs.config import config_options
+
+log = logging.getLogger('mkdocs.plugins.link_index')
+
+FENCE_RE = re.compile(r'^([ \t]*)(`{3,}|~{3,}).*?^\1\2[`~]*[ \t]*$', re.MULTILINE | re.DOTALL)
+INLINE_CODE_RE = re.compile(r'`[^`\n]*`')
+# Destinations are either `<...>` (spaces allowed) or a bare run of non-spaces.
+DEST = r'(?:<([^<>\n]*)>|([^\s<>()]+))'
+TITLE = r'(?:\s+(?:"[^"]*"|\'[^\']*\'|\([^)]*\)))?'
+LINK_RE = re.compile(r'(!?)\[[^\]]*\]\(\s*' + DEST + TITLE + r'\s*\)')
+REF_DEF_RE = re.compile(r'^ {0,3}\[([^\]]+)\]:\s*' + DEST + TITLE + r'[ \t]*$', re.MULTILINE)
+# `[text][label]`, `[label][]` and shortcut `[label]` references.
+REF_LINK_RE = re.compile(r'(!?)(?<!\])\[([^\]]+)\](?:\[([^\]]*)\]|(?![(:\[]))')
+HEADING_RE = re.compile(r'^#\s+(.+?)\s*#*\s*$', re.MULTILINE)
+
+
+def _ref_label(label):
+    """Normalise a link reference label (case and whitespace insensitive)."""
+    return ' '.join(label.lower().split())
+
+
+def extract_links(markdown, src_path):
+    """Return (target, anchor) pairs for local page links in a markdown source.
+
+    Inline links and reference-style links (with their `[label]: url`
+    definitions) are both recognised. Targets are resolved relative to
+    `src_path` and normalised to docs-relative POSIX paths. External URLs,
+    images and links inside code are ignored; a bare `#anchor` link resolves to
+    the page itself.
+    """
+    text = FENCE_RE.sub('', markdown)
+    text = INLINE_CODE_RE.sub('', text)
+    base_dir = posixpath.dirname(src_path)
+
+    definitions = {}
+    for match in REF_DEF_RE.finditer(text):
+        definitions.setdefault(_ref_label(match.group(1)), match.group(2) or match.group(3))
+    text = REF_DEF_RE.sub('', text)
+
+    urls = [
+        match.group(2) if match.group(2) is not None else match.group(3)
+        for match in LINK_RE.finditer(text) if not match.group(1)
+    ]
+    text = LINK_RE.sub('', text)
+    for match in REF_LINK_RE.finditer(text):
+        if match.group(1):
+            continue
+        label = _ref_label(match.group(3) or match.group(2))
+        if label in definitions:
+            urls.append(definitions[label])
+
+    links = []
+    for url in urls:
+        parts = urlsplit(url.strip())
+        if parts.scheme or parts.netloc:
+            continue
+        path = unquote(parts.path)
+        if not path:
+            target = src_path
+        elif path.endswith('.md'):
+            target = posixpath.normpath(posixpath.join(base_dir, path))
+        else:
+            continue
+        links.append((target, parts.fragment))
+
+    return links
+
+
+def extract_title(markdown, src_path):
+    """Return the first level-one heading of a page, or its path as a fallback."""
+    match = HEADING_RE.search(FENCE_RE.sub('', markdown))
+    return match.group(1).strip() if match else src_path
+
+
+class LinkIndex:
+    """Inverted index from target page and anchor to referring pages."""
+
+    def __init__(self):
+        self.backlinks = {}
+        self.titles = {}
+        self.nav_pages = set()
+
+    @classmethod
+    def build(cls, sources, nav_pages=()):
+        """Build the index from a mapping of docs-relative path to markdown source."""
+        index = cls()
+        index.nav_pages = set(nav_pages)
+
+        for src_path in sorted(sources):
+            markdown = sources[src_path]
+            index.titles[src_path] = extract_title(markdown, src_path)
+            for target, anchor in extract_links(markdown, src_path):
+                if target == src_path:
+                    continue
+                referrers = index.backlinks.setdefault(target, {}).setdefault(anchor, [])
+                if src_path not in referrers:
+                    referrers.append(src_path)
+
+        # Drop links to pages that do not exist; MkDocs already reports those.
+        for target in list(index.backlinks):
+            if target not in index.titles:
+                del index.backlinks[target]
+
+        return index
+
+    def referrers(self, target, anchor=None):
+        """Return the sorted pages linking to `target` (optionally a single anchor)."""
+        anchors = self.backlinks.get(target, {})
+        if anchor is not None:
+            return sorted(anchors.get(anchor, []))
+        return sorted({src for refs in anchors.values() for src in refs})
+
+    def orphans(self):
+        """Return pages that are neither in the nav nor linked from any other page."""
+        return sorted(
+            src_path for src_path in self.titles
+            if src_path not in self.nav_pages and not self.backlinks.get(src_path)
+        )
+
+
+class LinkIndexPlugin(BasePlugin):
+    """Plugin to precompute the backlink index and flag orphaned pages."""
+
+    config_scheme = (
+        ('enabled', config_options.Type(bool, default=True)),
+        ('warn_orphans', config_options.Type(bool, default=False)),
+    )
+
+    def __init__(self):
+        super().__init__()
+        self.index = LinkIndex()
+
+    def on_nav(self, nav, config, files):
+        """Scan every documentation page once and build the link index."""
+
+        if not self.config['enabled']:
+            return nav
+
+        auto_toc = config.plugins.get('auto_toc')
+
+        sources = {}
+        for file in files.documentation_pages():
+            try:
+                markdown = file.content_string
+            except (OSError, ValueError) as e:
+                log.warning(f"Could not read {file.src_uri}: {e}")
+                continue
+
+            # Expand the AUTO_TOC marker so its generated links are indexed too.
+            if auto_toc is not None:
+                markdown = auto_toc.expand_marker(markdown, config)
+            sources[file.src_uri] = markdown
+
+        nav_pages = [page.file.src_uri for page in nav.pages]
+        self.index = LinkIndex.build(sources, nav_pages)
+
+        report = log.warning if self.config['warn_orphans'] else log.info
+        for src_path in self.index.orphans():
+            report(f"Orphaned page (not in nav and not linked from any page): {src_path}")
+
+        return nav
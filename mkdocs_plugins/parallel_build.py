@@ -0,0 +1,311 @@
+"""
+Sharded parallel build driver for MkDocs.
+
+Splits the pages into shards by top-level `nav` section and renders the shards
+in worker processes, then merges everything into a single `site/` directory.
+
+The parent process runs every build-wide step exactly as `mkdocs build` does
+(config, files, nav, the link index, static files, sitemap, `post_build`), so
+workers are forked from a process that already holds the shared metadata. Page
+work is split into two parallel phases, mirroring the serial build:
+
+1. Markdown is converted for each shard and the page state is sent back, so
+   every page title and TOC is known before any template is rendered.
+2. Templates are rendered for each shard; search entries are returned and
+   merged in serial page order so `search_index.json` matches a serial build.
+
+The driver reuses private build helpers and page attributes of MkDocs 1.6
+(`_populate_page`, `_build_page`, anchor validation), so it refuses to run on
+any other minor version. CI diffs its output against a serial build.
+
+Usage:
+    python -m mkdocs_plugins.parallel_build [--jobs N] [--strict] [--site-dir DIR]
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import sys
+import time
+
+import mkdocs
+from mkdocs import config as mkdocs_config
+from mkdocs import utils
+from mkdocs.commands import build as mkdocs_build
+from mkdocs.exceptions import Abort, BuildError
+from mkdocs.structure.files import get_files, set_exclusions
+from mkdocs.structure.nav import Section, get_navigation
+from mkdocs.structure.pages import Page
+
+log = logging.getLogger('mkdocs.parallel_build')
+
+# MkDocs minor version whose build internals this driver mirrors.
+SUPPORTED_MKDOCS = (1, 6)
+
+# Page attributes produced by `_populate_page` that later build steps rely on.
+PAGE_STATE = ('markdown', 'meta', 'content', 'toc', '_title_from_render', 'present_anchor_ids')
+
+# Build state inherited by forked workers; set by the parent before each phase.
+_state = {}
+
+
+def shard_pages(nav, doc_files):
+    """Group documentation pages by top-level nav section.
+
+    Returns a list of shards, each a list of `src_uri`s in serial build order.
+    Top-level pages outside any section and pages missing from the nav get a
+    shard of their own.
+    """
+    section_of = {}
+    for position, item in enumerate(nav.items):
+        if isinstance(item, Section):
+            pages = _section_pages(item)
+        else:
+            # Top-level links (e.g. external URLs) have no page to render.
+            pages = [item] if isinstance(item, Page) else []
+        for page in pages:
+            section_of[page.file.src_uri] = position
+
+    shards = {}
+    for file in doc_files:
+        key = section_of.get(file.src_uri, len(nav.items))
+        shards.setdefault(key, []).append(file.src_uri)
+
+    return [shards[key] for key in sorted(shards)]
+
+
+def _section_pages(section):
+    """Return every page below a nav section."""
+    pages = []
+    for child in section.children:
+        if isinstance(child, Section):
+            pages.extend(_section_pages(child))
+        elif isinstance(child, Page):
+            pages.append(child)
+    return pages
+
+
+def _search_index(config):
+    """Return the search plugin's index object, if search is enabled."""
+    for plugin in config.plugins.values():
+        index = getattr(plugin, 'search_index', None)
+        if index is not None:
+            return index
+    return None
+
+
+def _search_entries(index):
+    """Return the mutable list of entries of a search index."""
+    return index.entries if hasattr(index, 'entries') else index._entries
+
+
+def _count_warnings(task, shard):
+    """Run a worker task while counting warnings logged under `mkdocs`."""
+    counter = utils.CountHandler()
+    counter.setLevel(logging.WARNING)
+    logging.getLogger('mkdocs').addHandler(counter)
+    try:
+        return task(shard), counter.get_counts()
+    finally:
+        logging.getLogger('mkdocs').removeHandler(counter)
+
+
+def _populate_shard(shard):
+    """Worker: convert the Markdown of a shard's pages and return their state."""
+    config, files = _state['config'], _state['files']
+    results = {}
+
+    for src_uri in shard:
+        page = files.get_file_from_path(src_uri).page
+        mkdocs_build._populate_page(page, config, files)
+        state = {name: getattr(page, name) for name in PAGE_STATE}
+        state['title'] = page.__dict__.get('title')
+        # Files don't survive the trip between processes; key by source path.
+        state['links_to_anchors'] = {
+            to_file.src_uri: links for to_file, links in (page.links_to_anchors or {}).items()
+        }
+        results[src_uri] = state
+
+    return results
+
+
+def _build_shard(shard):
+    """Worker: render a shard's pages to `site_dir` and return their search entries."""
+    config, files, nav, env = _state['config'], _state['files'], _state['nav'], _state['env']
+    doc_files = _state['doc_files']
+    index = _search_index(config)
+    results = {}
+
+    for src_uri in shard:
+        file = files.get_file_from_path(src_uri)
+        entries = _search_entries(index) if index is not None else []
+        start = len(entries)
+        mkdocs_build._build_page(
+            file.page, config, doc_files, nav, env, excluded=file.inclusion.is_excluded()
+        )
+        results[src_uri] = entries[start:]
+
+    return results
+
+
+def _restore_page(page, state, files):
+    """Apply the page state returned by a populate worker."""
+    for name in PAGE_STATE:
+        setattr(page, name, state[name])
+    if state['title'] is not None:
+        page.title = state['title']
+    page.links_to_anchors = {
+        files.get_file_from_path(src_uri): links
+        for src_uri, links in state['links_to_anchors'].items()
+    }
+
+
+def _run_phase(pool_context, jobs, task, shards, warnings):
+    """Run `task` over every shard in a fresh worker pool and merge the results."""
+    merged = {}
+    with pool_context.Pool(min(jobs, len(shards)) or 1) as pool:
+        calls = [(task, shard) for shard in shards]
+        for result, counts in pool.starmap(_count_warnings, calls):
+            merged.update(result)
+            for level, count in counts:
+                warnings[level] = warnings.get(level, 0) + count
+    return merged
+
+
+def check_mkdocs_version():
+    """Abort unless the installed MkDocs matches `SUPPORTED_MKDOCS`."""
+    version = tuple(int(part) for part in mkdocs.__version__.split('.')[:2])
+    if version != SUPPORTED_MKDOCS:
+        supported = '.'.join(map(str, SUPPORTED_MKDOCS))
+        raise Abort(
+            f"The parallel build requires MkDocs {supported}.x, found {mkdocs.__version__}. "
+            "Use `mkdocs build` instead."
+        )
+
+
+def build(config, jobs=None):
+    """Perform a full site build, rendering nav sections in parallel."""
+    check_mkdocs_version()
+    if jobs is not None and jobs < 1:
+        raise Abort(f"jobs must be at least 1, got {jobs}")
+    jobs = jobs or os.cpu_count() or 1
+    pool_context = multiprocessing.get_context('fork')
+
+    warning_counter = utils.CountHandler()
+    warning_counter.setLevel(logging.WARNING)
+    if config.strict:
+        logging.getLogger('mkdocs').addHandler(warning_counter)
+
+    try:
+        start = time.monotonic()
+
+        config = config.plugins.on_config(config)
+        config.plugins.on_pre_build(config=config)
+
+        log.info("Cleaning site directory")
+        utils.clean_directory(config.site_dir)
+        log.info(f"Building documentation to directory: {config.site_dir}")
+
+        files = get_files(config)
+        env = config.theme.get_env()
+        files.add_files_from_theme(env, config)
+        files = config.plugins.on_files(files, config=config)
+        set_exclusions(files, config)
+
+        nav = get_navigation(files, config)
+        nav = config.plugins.on_nav(nav, config=config, files=files)
+
+        doc_files = files.documentation_pages()
+        for file in doc_files:
+            if file.page is None and file.inclusion.is_not_in_nav():
+                Page(None, file, config)
+
+        shards = shard_pages(nav, doc_files)
+        log.info(f"Rendering {len(shards)} nav sections with {min(jobs, len(shards))} workers")
+        worker_warnings = {}
+
+        _state.update(config=config, files=files, nav=nav)
+        populated = _run_phase(pool_context, jobs, _populate_shard, shards, worker_warnings)
+        for file in doc_files:
+            _restore_page(file.page, populated[file.src_uri], files)
+
+        env = config.plugins.on_env(env, config=config, files=files)
+
+        files.copy_static_files()
+        for template in config.theme.static_templates:
+            mkdocs_build._build_theme_template(template, env, files, config, nav)
+        for template in config.extra_templates:
+            mkdocs_build._build_extra_template(template, files, config, nav)
+
+        _state.update(env=env, doc_files=doc_files)
+        built = _run_phase(pool_context, jobs, _build_shard, shards, worker_warnings)
+        search_index = _search_index(config)
+        if search_index is not None:
+            entries = _search_entries(search_index)
+            for file in doc_files:
+                entries.extend(built[file.src_uri])
+
+        log_level = config.validation.links.anchors
+        for file in doc_files:
+            file.page.validate_anchor_links(files=files, log_level=log_level)
+
+        config.plugins.on_post_build(config=config)
+
+        counts = dict(warning_counter.get_counts())
+        for level, count in worker_warnings.items():
+            counts[level] = counts.get(level, 0) + count
+        if config.strict and counts:
+            msg = ', '.join(f'{v} {k.lower()}s' for k, v in counts.items())
+            raise Abort(f'Aborted with {msg} in strict mode!')
+
+        log.info(f'Documentation built in {time.monotonic() - start:.2f} seconds')
+
+    except Exception as e:
+        config.plugins.on_build_error(error=e)
+        if isinstance(e, BuildError):
+            log.error(str(e))
+            raise Abort('Aborted with a BuildError!')
+        raise
+
+    finally:
+        _state.clear()
+        logging.getLogger('mkdocs').removeHandler(warning_counter)
+
+
+def _positive_int(value):
+    """argparse type for a strictly positive integer."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-f', '--config-file', default='mkdocs.yml', help="MkDocs config file")
+    parser.add_argument('-d', '--site-dir', help="Directory to write the site to")
+    parser.add_argument('-j', '--jobs', type=_positive_int, help="Worker processes (default: CPU count)")
+    parser.add_argument('-s', '--strict', action='store_true', help="Abort on warnings")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(format='%(levelname)-8s -  %(message)s', level=logging.INFO)
+
+    overrides = {'site_dir': args.site_dir} if args.site_dir else {}
+    if args.strict:
+        overrides['strict'] = True
+    cfg = mkdocs_config.load_config(config_file=args.config_file, **overrides)
+    cfg.plugins.on_startup(command='build', dirty=False)
+    try:
+        build(cfg, jobs=args.jobs)
+    except Abort as e:
+        log.error(str(e))
+        return 1
+    finally:
+        cfg.plugins.on_shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,414 @@
+"""
+MkDocs plugin to prebuild a compact, sharded search index.
+
+The `search` plugin writes one monolithic `search/search_index.json` that
+the theme's client downloads and tokenizes. This plugin post-processes that
+file into an inverted index with tokenization done at build time, split into
+shards so a client that uses it only loads the shards its query needs:
+
+    search/prebuilt/manifest.json        config, string table, documents, shard list
+    search/prebuilt/shards/<key>.json    {term: [doc, title_tf, text_tf, doc, ...]}
+
+Documents are `[location, title_id, snippet]` triples; titles live once in a
+string table and snippets hold the start of the section text for result
+previews. Doc ids in each posting list are delta-encoded.
+
+Terms are produced the way the theme's lunr client would: lowercased, split
+on the search `separator`, then run through the configured search `pipeline`
+(`trimmer`, `stopWordFilter`, `stemmer`). Stemming uses the Porter algorithm
+as implemented by `lunr.stemmer`; stop words and stemming are English only.
+
+With `shard_by: prefix` a term lives in the shard named after its first
+`prefix_length` characters, so a query loads one shard per term. With
+`shard_by: section` each top-level docs directory gets its own shard, and an
+unscoped query has to load all of them. The table that the `auto_toc` plugin
+generates repeats other pages' titles and descriptions; it is removed from
+the body text of the page that contains it before indexing.
+
+The original `search_index.json` is left untouched, and the theme's search
+box keeps using it: this index is for clients that opt in to it.
+"""
+
+import functools
+import json
+import logging
+import os
+import re
+from html import unescape
+
+from mkdocs.plugins import BasePlugin, event_priority
+from mkdocs.config import config_options
+from mkdocs.config.base import ValidationError
+
+log = logging.getLogger('mkdocs.plugins.search_shards')
+
+TAG_RE = re.compile(r'<[^>]+>')
+# lunr's `trimmer` uses JavaScript's ASCII-only \W.
+TOKEN_STRIP_RE = re.compile(r'^\W+|\W+$', re.ASCII)
+TOC_ROW_RE = re.compile(r'^\s*\|\s*\[(.+?)\]\([^)]*\)\s*\|\s*(.*?)\s*\|\s*$')
+TOC_ITEM_RE = re.compile(r'^\s*-\s*\[(.+?)\]\([^)]*\)\s*-\s*(.*?)\s*$')
+TOC_HEADER_RE = re.compile(r'^\s*\|\s*(\w[^|]*?)\s*\|\s*(\w[^|]*?)\s*\|\s*$')
+
+# Stop words removed by lunr's `stopWordFilter`.
+STOP_WORDS = frozenset("""
+a able about across after all almost also am among an and any are as at be because been
+but by can cannot could dear did do does either else ever every for from get got had has
+have he her hers him his how however i if in into is it its just least let like likely
+may me might most must my neither no nor not of off often on only or other our own rather
+said say says she should since so some than that the their them then there these they
+this tis to too twas us wants was we were what when where which while who whom why will
+with would yet you your
+""".split())
+
+
+def _is_consonant(word, i):
+    """Return whether `word[i]` is a consonant in the Porter sense."""
+    ch = word[i]
+    if ch in 'aeiou':
+        return False
+    if ch == 'y':
+        return i == 0 or not _is_consonant(word, i - 1)
+    return True
+
+
+def _measure(stem):
+    """Return the number of vowel-consonant sequences (m) in a stem."""
+    m = 0
+    prev_vowel = False
+    for i in range(len(stem)):
+        consonant = _is_consonant(stem, i)
+        if consonant and prev_vowel:
+            m += 1
+        prev_vowel = not consonant
+    return m
+
+
+def _has_vowel(stem):
+    return any(not _is_consonant(stem, i) for i in range(len(stem)))
+
+
+def _ends_double_consonant(word):
+    return len(word) > 1 and word[-1] == word[-2] and _is_consonant(word, len(word) - 1)
+
+
+def _ends_cvc(word):
+    """Return whether a word ends consonant-vowel-consonant, last not w, x or y."""
+    return (
+        len(word) > 2
+        and _is_consonant(word, len(word) - 1)
+        and not _is_consonant(word, len(word) - 2)
+        and _is_consonant(word, len(word) - 3)
+        and word[-1] not in 'wxy'
+    )
+
+
+def _replace_suffix(word, rules, min_measure):
+    """Apply the first matching (suffix, replacement) rule if the stem is long enough."""
+    for suffix, replacement in rules:
+        if word.endswith(suffix):
+            stem = word[:-len(suffix)]
+            return stem + replacement if _measure(stem) > min_measure else word
+    return word
+
+
+STEP2_RULES = (
+    ('ational', 'ate'), ('tional', 'tion'), ('enci', 'ence'), ('anci', 'ance'),
+    ('izer', 'ize'), ('bli', 'ble'), ('alli', 'al'), ('entli', 'ent'), ('eli', 'e'),
+    ('ousli', 'ous'), ('ization', 'ize'), ('ation', 'ate'), ('ator', 'ate'),
+    ('alism', 'al'), ('iveness', 'ive'), ('fulness', 'ful'), ('ousness', 'ous'),
+    ('aliti', 'al'), ('iviti', 'ive'), ('biliti', 'ble'), ('logi', 'log'),
+)
+STEP3_RULES = (
+    ('icate', 'ic'), ('ative', ''), ('alize', 'al'), ('iciti', 'ic'), ('ical', 'ic'),
+    ('ful', ''), ('ness', ''),
+)
+STEP4_SUFFIXES = (
+    'al', 'ance', 'ence', 'er', 'ic', 'able', 'ible', 'ant', 'ement', 'ment', 'ent',
+    'ion', 'ou', 'ism', 'ate', 'iti', 'ous', 'ive', 'ize',
+)
+
+
+@functools.lru_cache(maxsize=None)
+def stem(word):
+    """Reduce an English word to its Porter stem."""
+    if len(word) < 3:
+        return word
+
+    # Like lunr's regexes (`^(.+?)...$`), every suffix rule needs a non-empty stem.
+
+    # Step 1a: plurals
+    if word.endswith(('sses', 'ies')) and len(word) > (4 if word.endswith('sses') else 3):
+        word = word[:-2]
+    elif word.endswith('s') and not word.endswith('ss'):
+        word = word[:-1]
+
+    # Step 1b: past tenses and gerunds
+    if word.endswith('eed') and len(word) > 3:
+        if _measure(word[:-3]) > 0:
+            word = word[:-1]
+    else:
+        for suffix in ('ed', 'ing'):
+            if word.endswith(suffix) and _has_vowel(word[:-len(suffix)]):
+                word = word[:-len(suffix)]
+                if word.endswith(('at', 'bl', 'iz')):
+                    word += 'e'
+                elif _ends_double_consonant(word) and word[-1] not in 'lsyz':
+                    word = word[:-1]
+                elif _measure(word) == 1 and _ends_cvc(word):
+                    word += 'e'
+                break
+
+    # Step 1c: lunr only turns y into i after a consonant (`^(.+?[^aeiou])y$`)
+    if len(word) > 2 and word.endswith('y') and word[-2] not in 'aeiou':
+        word = word[:-1] + 'i'
+
+    word = _replace_suffix(word, STEP2_RULES, 0)
+    word = _replace_suffix(word, STEP3_RULES, 0)
+
+    # Step 4: strip remaining suffixes from long stems
+    for suffix in sorted(STEP4_SUFFIXES, key=len, reverse=True):
+        if word.endswith(suffix):
+            base = word[:-len(suffix)]
+            if _measure(base) > 1 and (suffix != 'ion' or base.endswith(('s', 't'))):
+                word = base
+            break
+
+    # Step 5
+    if word.endswith('e'):
+        base = word[:-1]
+        m = _measure(base)
+        if m > 1 or (m == 1 and not _ends_cvc(base)):
+            word = base
+    if word.endswith('ll') and _measure(word) > 1:
+        word = word[:-1]
+
+    return word
+
+
+def tokenize(text, separator, pipeline=('stopWordFilter',)):
+    """Split text into index terms, applying the search pipeline's filters."""
+    trim = 'trimmer' in pipeline
+    drop_stop_words = 'stopWordFilter' in pipeline
+    apply_stemmer = 'stemmer' in pipeline
+
+    terms = []
+    for token in re.split(separator, text.lower()):
+        if trim:
+            token = TOKEN_STRIP_RE.sub('', token)
+        if not token or (drop_stop_words and token in STOP_WORDS):
+            continue
+        terms.append(stem(token) if apply_stemmer else token)
+    return terms
+
+
+def _plain_text(html):
+    return ' '.join(unescape(TAG_RE.sub(' ', html)).split())
+
+
+def _snippet(text, length):
+    """Return the start of a section's text, cut at a word boundary."""
+    if len(text) <= length:
+        return text
+    return text[:length].rsplit(' ', 1)[0] + '…'
+
+
+def auto_toc_phrases(toc_content):
+    """Return the plain-text phrases an `auto_toc` table contributes to a page.
+
+    Each generated row ends up in the search text as its link title followed
+    by its description; the table header contributes its two column names.
+    """
+    phrases = []
+    for line in toc_content.splitlines():
+        row = TOC_ROW_RE.match(line)
+        item = TOC_ITEM_RE.match(line)
+        header = TOC_HEADER_RE.match(line)
+        if row:
+            phrases.append(' '.join(row.groups()))
+        elif item:
+            phrases.append(' - '.join(item.groups()))
+        elif header:
+            phrases.append(' '.join(header.groups()))
+
+    # Rendered Markdown drops inline formatting characters.
+    return [' '.join(re.sub(r'[`*]', '', phrase).split()) for phrase in phrases if phrase]
+
+
+def shard_key(term, prefix_length):
+    """Return the prefix shard a term belongs to (filesystem-safe)."""
+    prefix = term[:prefix_length]
+    return ''.join(ch if ch.isascii() and ch.isalnum() else '_' for ch in prefix)
+
+
+def section_key(location):
+    """Return the section shard for a document location."""
+    path = location.split('#', 1)[0].strip('/')
+    return path.split('/', 1)[0] if path else 'index'
+
+
+def build_index(search_index, shard_by='prefix', prefix_length=1, generated_text=None,
+                snippet_length=160):
+    """Build the manifest and shards from a parsed `search_index.json`.
+
+    `generated_text` maps page URLs to phrases (see `auto_toc_phrases`) that
+    are removed from the body text of that page's entries only.
+
+    Returns `(manifest, shards)` where `shards` maps shard keys to inverted
+    indexes of `{term: [doc, title_tf, text_tf, ...]}` with delta-encoded docs.
+    """
+    config = search_index.get('config', {})
+    separator = config.get('separator', r'[\s\-]+')
+    pipeline = list(config.get('pipeline', []))
+    lang = config.get('lang', ['en'])
+    lang = [lang] if isinstance(lang, str) else list(lang)
+    entries = search_index.get('docs', [])
+
+    if lang != ['en'] and {'stopWordFilter', 'stemmer'} & set(pipeline):
+        log.warning(f"Search language {lang} is not supported; indexing without stop words or stemming")
+        pipeline = [step for step in pipeline if step == 'trimmer']
+
+    generated_res = {
+        url: re.compile('|'.join(re.escape(p) for p in sorted(phrases, key=len, reverse=True)),
+                        re.IGNORECASE)
+        for url, phrases in (generated_text or {}).items() if phrases
+    }
+
+    strings, string_ids, docs = [], {}, []
+    shards = {}
+    for doc_id, entry in enumerate(entries):
+        location = entry.get('location', '')
+        title = entry.get('title', '')
+        if title not in string_ids:
+            string_ids[title] = len(strings)
+            strings.append(title)
+
+        text = _plain_text(entry.get('text', ''))
+        generated_re = generated_res.get(location.split('#', 1)[0])
+        if generated_re is not None:
+            text = ' '.join(generated_re.sub(' ', text).split())
+        docs.append([location, string_ids[title], _snippet(text, snippet_length)])
+
+        counts = {}
+        for field, value in (('title', _plain_text(title)), ('text', text)):
+            for term in tokenize(value, separator, pipeline):
+                tf = counts.setdefault(term, [0, 0])
+                tf[0 if field == 'title' else 1] += 1
+
+        for term, (title_tf, text_tf) in counts.items():
+            if shard_by == 'section':
+                key = section_key(location)
+            else:
+                key = shard_key(term, prefix_length)
+            shards.setdefault(key, {}).setdefault(term, []).append((doc_id, title_tf, text_tf))
+
+    for index in shards.values():
+        for term, postings in index.items():
+            encoded, prev = [], 0
+            for doc_id, title_tf, text_tf in postings:
+                encoded.extend((doc_id - prev, title_tf, text_tf))
+                prev = doc_id
+            index[term] = encoded
+
+    manifest = {
+        'config': {
+            'separator': separator,
+            'lang': lang,
+            'pipeline': pipeline,
+            'shard_by': shard_by,
+            'prefix_length': prefix_length,
+            'fields': config.get('fields', {}),
+        },
+        'strings': strings,
+        'docs': docs,
+        'shards': sorted(shards),
+    }
+    return manifest, shards
+
+
+class _MinInt(config_options.Type):
+    """Integer config option with a lower bound."""
+
+    def __init__(self, minimum, **kwargs):
+        super().__init__(int, **kwargs)
+        self.minimum = minimum
+
+    def run_validation(self, value):
+        value = super().run_validation(value)
+        if value < self.minimum:
+            raise ValidationError(f"Expected a value of at least {self.minimum}, got {value}")
+        return value
+
+
+def _dump(data):
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False, sort_keys=True)
+
+
+class SearchShardsPlugin(BasePlugin):
+    """Plugin to write a compact, sharded, prebuilt search index."""
+
+    config_scheme = (
+        ('enabled', config_options.Type(bool, default=True)),
+        ('shard_by', config_options.Choice(('prefix', 'section'), default='prefix')),
+        ('prefix_length', _MinInt(1, default=1)),
+        ('snippet_length', config_options.Type(int, default=160)),
+        ('output_dir', config_options.Type(str, default='search/prebuilt')),
+    )
+
+    def __init__(self):
+        super().__init__()
+        self.generated_text = {}
+
+    def on_nav(self, nav, config, files):
+        """Record the text the auto_toc plugin will generate, per page URL."""
+
+        self.generated_text = {}
+        auto_toc = config.plugins.get('auto_toc')
+        if not self.config['enabled'] or auto_toc is None:
+            return nav
+
+        for file in files.documentation_pages():
+            try:
+                toc_content = auto_toc.generated_toc(file.content_string, config)
+            except (OSError, ValueError) as e:
+                log.warning(f"Could not read {file.src_uri}: {e}")
+                continue
+            if toc_content is None:
+                continue
+            phrases = auto_toc_phrases(toc_content)
+            # Search locations use page URLs, where the homepage is '' rather than './'.
+            url = '' if file.url in ('.', './') else file.url
+            self.generated_text[url] = phrases
+
+        return nav
+
+    @event_priority(-50)
+    def on_post_build(self, config):
+        """Convert the search plugin's index into prebuilt shards."""
+
+        if not self.config['enabled']:
+            return
+
+        index_path = os.path.join(config['site_dir'], 'search', 'search_index.json')
+        if not os.path.exists(index_path):
+            log.warning(f"No search index found at {index_path}; is the search plugin enabled?")
+            return
+
+        with open(index_path, 'r', encoding='utf-8') as f:
+            search_index = json.load(f)
+
+        manifest, shards = build_index(
+            search_index, self.config['shard_by'], self.config['prefix_length'],
+            self.generated_text, self.config['snippet_length'],
+        )
+
+        # Shards get their own directory so no shard key can clash with the manifest.
+        output_dir = os.path.join(config['site_dir'], self.config['output_dir'])
+        shard_dir = os.path.join(output_dir, 'shards')
+        os.makedirs(shard_dir, exist_ok=True)
+        with open(os.path.join(output_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+            f.write(_dump(manifest))
+        for key, shard in shards.items():
+            with open(os.path.join(shard_dir, f'{key}.json'), 'w', encoding='utf-8') as f:
+                f.write(_dump(shard))
+
+        log.info(f"Prebuilt search index: {len(manifest['docs'])} documents in {len(shards)} shards")
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark the prebuilt search index against the monolithic search_index.json.
+
+Reports payload sizes (raw and gzipped) and the time taken to build the
+prebuilt index, for prefix and section sharding. Run `make docs-build` first.
+
+"First query" is what a client downloads before it can answer a one-term
+query: the manifest plus one shard in prefix mode, but the manifest plus every
+shard in section mode, since the term may occur in any section. The benchmark
+works from search_index.json alone, so the AUTO_TOC table is still indexed
+here; the built site's shards are slightly smaller.
+
+Usage:
+    python scripts/benchmark-search-index.py [path/to/search_index.json] [--repeat N]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from mkdocs_plugins.search_shards import _dump, build_index  # noqa: E402
+
+
+def sizes(data):
+    """Return raw and gzipped byte sizes of a string."""
+    raw = data.encode('utf-8')
+    return len(raw), len(gzip.compress(raw, mtime=0))
+
+
+def format_kb(size):
+    return f"{size / 1024:8.1f} KB"
+
+
+def benchmark(search_index, shard_by, prefix_length, repeat):
+    """Build the prebuilt index `repeat` times and report the best time and sizes."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        manifest, shards = build_index(search_index, shard_by, prefix_length)
+        timings.append(time.perf_counter() - start)
+
+    manifest_raw, manifest_gz = sizes(_dump(manifest))
+    shard_sizes = [sizes(_dump(shard)) for shard in shards.values()]
+    total_raw = manifest_raw + sum(raw for raw, _ in shard_sizes)
+    total_gz = manifest_gz + sum(gz for _, gz in shard_sizes)
+    largest_gz = max(gz for _, gz in shard_sizes)
+    average_gz = sum(gz for _, gz in shard_sizes) / len(shard_sizes)
+    if shard_by == 'section':
+        first_query, first_query_label = total_gz, "manifest + all shards"
+    else:
+        first_query, first_query_label = manifest_gz + average_gz, "manifest + 1 avg shard"
+
+    label = f"{shard_by} (length {prefix_length})" if shard_by == 'prefix' else shard_by
+    print(f"\n📦 Sharded by {label}")
+    print(f"  Build time (best of {repeat}): {min(timings) * 1000:.1f} ms")
+    print(f"  Shards:                 {len(shards)}")
+    print(f"  Manifest:               {format_kb(manifest_raw)} raw, {format_kb(manifest_gz)} gzip")
+    print(f"  All shards + manifest:  {format_kb(total_raw)} raw, {format_kb(total_gz)} gzip")
+    print(f"  Largest shard:          {format_kb(largest_gz)} gzip")
+    print(f"  Average shard:          {format_kb(average_gz)} gzip")
+    print(f"  First query ({first_query_label}): {format_kb(first_query)} gzip")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the prebuilt search index")
+    parser.add_argument('index', nargs='?', default='site/search/search_index.json')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.index):
+        print(f"❌ {args.index} not found. Run: make docs-build")
+        return 1
+
+    with open(args.index, 'r', encoding='utf-8') as f:
+        data = f.read()
+    search_index = json.loads(data)
+
+    raw, gz = sizes(data)
+    print("🔍 Search index benchmark")
+    print("=" * 50)
+    print(f"Documents: {len(search_index.get('docs', []))}")
+    print("\n📄 Monolithic search_index.json")
+    print(f"  Size:                   {format_kb(raw)} raw, {format_kb(gz)} gzip")
+
+    for prefix_length in (1, 2):
+        benchmark(search_index, 'prefix', prefix_length, args.repeat)
+    benchmark(search_index, 'section', 0, args.repeat)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Check the prebuilt search index's stemmer against lunr.stemmer.
+
+Clients stem queries with lunr, so every word the build stems must come out
+exactly as lunr would stem it. This stems every word in a built site's
+search_index.json, plus a list of classic Porter test words, with both
+implementations and reports any difference. lunr is taken from the copy
+bundled with MkDocs' search plugin and run with Node.js.
+
+Usage:
+    python scripts/check-search-stemmer.py [path/to/search_index.json]
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import mkdocs  # noqa: E402
+from mkdocs_plugins.search_shards import TOKEN_STRIP_RE, _plain_text, stem  # noqa: E402
+
+LUNR_JS = os.path.join(os.path.dirname(mkdocs.__file__), 'contrib', 'search', 'templates', 'search', 'lunr.js')
+
+PORTER_WORDS = """
+caresses ponies ties caress cats feed agreed disabled matting mating meeting milling messing
+meetings plastered bled motoring sing conflated troubled sized hopping tanned falling hissing
+fizzed failing filing happy sky try key delay relational conditional rational valenci hesitanci
+digitizer conformabli radicalli differentli vileli analogousli vietnamization predication operator
+feudalism decisiveness hopefulness callousness formaliti sensitiviti sensibiliti triplicate
+formative formalize electriciti electrical hopeful goodness revival allowance inference airliner
+gyroscopic adjustable defensible irritant replacement adjustment dependent adoption homologou
+communism activate angulariti homologous effective bowdlerize probate rate cease controll roll
+eed ies sses dies lies ties yyed syyed
+""".split()
+
+STEM_JS = """
+const lunr = require(process.argv[1]);
+const words = JSON.parse(require('fs').readFileSync(0, 'utf-8'));
+process.stdout.write(JSON.stringify(words.map(w => lunr.stemmer(new lunr.Token(w)).toString())));
+"""
+
+
+def index_words(index_path):
+    """Return the distinct trimmed, lowercased words of a search index."""
+    with open(index_path, 'r', encoding='utf-8') as f:
+        search_index = json.load(f)
+    separator = search_index.get('config', {}).get('separator', r'[\s\-]+')
+
+    words = set()
+    for entry in search_index.get('docs', []):
+        text = _plain_text(entry.get('title', '')) + ' ' + _plain_text(entry.get('text', ''))
+        for token in re.split(separator, text.lower()):
+            token = TOKEN_STRIP_RE.sub('', token)
+            if token:
+                words.add(token)
+    return words
+
+
+def main():
+    index_path = sys.argv[1] if len(sys.argv) > 1 else 'site/search/search_index.json'
+
+    if shutil.which('node') is None:
+        print("❌ Node.js is required to run lunr.stemmer")
+        return 1
+    if not os.path.exists(index_path):
+        print(f"❌ {index_path} not found. Run: make docs-build")
+        return 1
+
+    words = sorted(index_words(index_path) | set(PORTER_WORDS))
+    result = subprocess.run(
+        ['node', '-e', STEM_JS, LUNR_JS],
+        input=json.dumps(words), capture_output=True, text=True, check=True,
+    )
+    expected = json.loads(result.stdout)
+
+    mismatches = [(word, stem(word), lunr) for word, lunr in zip(words, expected) if stem(word) != lunr]
+    print(f"🔍 Compared {len(words)} words against lunr.stemmer")
+    for word, ours, lunr in mismatches:
+        print(f"  ❌ {word}: {ours} (lunr: {lunr})")
+    if mismatches:
+        print(f"❌ {len(mismatches)} words stem differently")
+        return 1
+
+    print("✅ Stemmer matches lunr.stemmer")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,12 +8,14 @@ setup(
     description='Local MkDocs plugins for Universal Smart Lighting Control documentation',
     packages=find_packages(),
     install_requires=[
-        'mkdocs>=1.5.0',
+        'mkdocs>=1.6,<1.7',
         'PyYAML>=6.0',
     ],
     entry_points={
         'mkdocs.plugins': [
             'auto_toc = mkdocs_plugins.auto_toc:AutoTocPlugin',
+            'link_index = mkdocs_plugins.link_index:LinkIndexPlugin',
+            'search_shards = mkdocs_plugins.search_shards:SearchShardsPlugin',
         ]
     }
 )